@@ -0,0 +1,99 @@
+"""
+Template Rendering Module
+Renders the generated application's sources from the Jinja2 templates in skeleton/.
+
+The skeleton templates use [[ ]], [% %] and [# #] delimiters so the {{ }} and
+{% %} tags of the generated Flask templates and Python f-strings pass through
+untouched. Compiled templates are kept in memory for the life of the process
+and in a persistent bytecode cache between runs.
+
+Set FLASK_WIZARD_TEMPLATE_DIR to a directory laid out like skeleton/ to
+override individual templates (for example an organisation-wide base.html.j2)
+without patching the wizard.
+"""
+
+import os
+import html
+import json
+from pathlib import Path
+from functools import lru_cache
+
+SKELETON_DIR = Path(__file__).parent / 'skeleton'
+BYTECODE_CACHE_DIR = Path(os.environ.get('FLASK_WIZARD_CACHE_DIR', Path.home() / '.cache' / 'flask-wizard')) / 'jinja'
+
+FEATURE_KEYS = ('user_auth', 'file_uploads', 'api_endpoints', 'background_tasks', 'metrics')
+
+
+def _python_docstring_text(value) -> str:
+    """Text that can sit inside a triple-quoted Python docstring."""
+    return str(value).replace('\\', '\\\\').replace('"""', '\\"\\"\\"')
+
+
+def _html_template_text(value) -> str:
+    """Text that renders literally in a generated Jinja/HTML template, as content or attribute value."""
+    return html.escape(str(value), quote=True).replace('{', '&#123;').replace('}', '&#125;')
+
+
+def template_search_path() -> list:
+    """Directories searched for skeleton templates, overrides first."""
+    search_path = []
+    override_dir = os.environ.get('FLASK_WIZARD_TEMPLATE_DIR')
+    if override_dir:
+        search_path.append(Path(override_dir))
+    search_path.append(SKELETON_DIR)
+    return search_path
+
+
+@lru_cache(maxsize=None)
+def _get_environment(search_path: tuple):
+    import jinja2
+
+    bytecode_cache = None
+    try:
+        BYTECODE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = jinja2.FileSystemBytecodeCache(str(BYTECODE_CACHE_DIR))
+    except OSError:
+        pass  # Read-only home directory: compile in memory only
+
+    environment = jinja2.Environment(
+        loader=jinja2.FileSystemLoader([str(path) for path in search_path]),
+        bytecode_cache=bytecode_cache,
+        block_start_string='[%',
+        block_end_string='%]',
+        variable_start_string='[[',
+        variable_end_string=']]',
+        comment_start_string='[#',
+        comment_end_string='#]',
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+        undefined=jinja2.StrictUndefined,
+        autoescape=False,
+        auto_reload=False,
+    )
+    # Python/JSON literals; Jinja's own tojson HTML-escapes quotes
+    environment.filters['pyjson'] = json.dumps
+    environment.filters['pydoc'] = _python_docstring_text
+    environment.filters['htmltext'] = _html_template_text
+    return environment
+
+
+def get_environment():
+    """Shared Jinja2 environment for the current template search path."""
+    return _get_environment(tuple(template_search_path()))
+
+
+def normalize_features(config: dict) -> dict:
+    """Feature flags with defaults filled in, accepting the legacy nested 'features' layout."""
+    features = config.get('features', {})
+    nested = features.get('features', {})
+    normalized = {'database': features.get('database', 'sqlite')}
+    for key in FEATURE_KEYS:
+        normalized[key] = bool(features.get(key, nested.get(key, False)))
+    return normalized
+
+
+def render(template_name: str, config: dict, **context) -> str:
+    """Render a skeleton template with the wizard configuration."""
+    template = get_environment().get_template(template_name)
+    return template.render(config=config, features=normalize_features(config), **context)
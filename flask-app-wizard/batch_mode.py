@@ -0,0 +1,169 @@
+"""
+Batch Mode Module
+Generates many Flask applications non-interactively from a JSON or TOML manifest.
+"""
+
+import io
+import json
+import time
+import contextlib
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from page_import import load_pages
+
+DEFAULT_NAV_ITEMS = [
+    {"name": "Dashboard", "route": "/", "icon": "home"},
+    {"name": "Settings", "route": "/settings", "icon": "gear"}
+]
+
+FEATURE_KEYS = ['user_auth', 'file_uploads', 'api_endpoints', 'background_tasks', 'metrics']
+
+
+def load_manifest(manifest_path: Path) -> tuple:
+    """Load app configs from a manifest file.
+
+    The manifest is either a list of app configs or a mapping with an ``apps``
+    list and optional ``defaults`` applied to every app. An app may name a
+    CSV/JSON sitemap in ``pages_file`` instead of listing ``nav_items``.
+
+    Each entry is validated on its own: returns ``(configs, invalid)`` where
+    ``invalid`` holds a failed result for every entry that could not be loaded,
+    so one bad entry does not stop the rest of the batch.
+    """
+    manifest_path = Path(manifest_path)
+    raw_text = manifest_path.read_text()
+
+    if manifest_path.suffix.lower() == '.toml':
+        try:
+            import tomllib
+        except ImportError:  # Python < 3.11
+            import tomli as tomllib
+        manifest = tomllib.loads(raw_text)
+    else:
+        manifest = json.loads(raw_text)
+
+    if isinstance(manifest, list):
+        manifest = {'apps': manifest}
+    if not isinstance(manifest.get('apps'), list):
+        raise ValueError(f"{manifest_path}: manifest must contain an 'apps' list")
+
+    defaults = manifest.get('defaults', {})
+    configs = []
+    invalid = []
+    seen_names = set()
+    for index, app in enumerate(manifest['apps'], start=1):
+        label = f"entry #{index}"
+        try:
+            if not isinstance(app, dict):
+                raise ValueError("app entry must be a mapping")
+            label = str(app.get('app_name') or '').strip() or label
+            merged = {**defaults, **app}
+            merged['features'] = {**defaults.get('features', {}), **app.get('features', {})}
+            pages_file = merged.pop('pages_file', None)
+            if pages_file:
+                # Sitemap paths are relative to the manifest
+                merged['nav_items'] = load_pages(manifest_path.parent / pages_file)
+            config = normalize_config(merged)
+            if config['app_name'] in seen_names:
+                raise ValueError(f"duplicate app_name {config['app_name']!r}")
+        except (ValueError, TypeError, OSError) as e:
+            invalid.append(_failed_result(label, f"{type(e).__name__}: {e}"))
+            continue
+        seen_names.add(config['app_name'])
+        configs.append(config)
+
+    return configs, invalid
+
+
+def _failed_result(app_name: str, error: str) -> dict:
+    return {'app_name': app_name, 'ok': False, 'path': None, 'error': error,
+            'conflicts': [], 'seconds': 0.0}
+
+
+def normalize_config(raw: dict) -> dict:
+    """Fill in the defaults the interactive prompts would have supplied."""
+    app_name = str(raw.get('app_name', '')).strip()
+    if not app_name:
+        raise ValueError("App name cannot be empty")
+
+    app_title = raw.get('app_title') or app_name.replace('-', ' ').title()
+    features = raw.get('features', {})
+
+    config = dict(raw)
+    config.update({
+        'app_name': app_name,
+        'app_title': app_title,
+        'description': raw.get('description') or f"A Flask web application: {app_title}",
+        'author': raw.get('author') or "Developer",
+        'nav_items': raw.get('nav_items') or [dict(item) for item in DEFAULT_NAV_ITEMS],
+    })
+    config['features'] = {'database': features.get('database', 'sqlite')}
+    for key in FEATURE_KEYS:
+        config['features'][key] = bool(features.get(key, False))
+    return config
+
+
+def _generate_one(config: dict, output_dir: str, wizard_options: dict) -> dict:
+    """Generate a single app in a worker process and report the outcome."""
+    from main_wizard import FlaskWizard
+
+    started = time.perf_counter()
+    result = {'app_name': config['app_name'], 'ok': False, 'path': None, 'error': None,
+              'conflicts': []}
+    options = dict(wizard_options)
+    for key in ('profile', 'cprofile'):
+        if options.get(key):
+            # One report per app: report.json -> report-<app_name>.json
+            path = Path(options[key])
+            options[key] = path.with_name(f"{path.stem}-{config['app_name']}{path.suffix}")
+    if options.get('archive'):
+        # --archive names a directory receiving <app_name>.<format> per app
+        options['archive_format'] = options.get('archive_format') or 'tar.gz'
+        options['archive'] = Path(options['archive']) / f"{config['app_name']}.{options['archive_format']}"
+    try:
+        wizard = FlaskWizard(config=config, output_dir=output_dir, **options)
+        # Per-file progress lines from many workers would interleave unreadably
+        with contextlib.redirect_stdout(io.StringIO()):
+            report = wizard.generate_app()
+        result['ok'] = True
+        if wizard.archive:
+            result['path'] = str(Path(wizard.archive).resolve())
+        else:
+            result['conflicts'] = report['conflicts']
+            result['path'] = str(wizard.app_output_path.resolve())
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+    result['seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch(manifest_path: Path, workers: int = None, output_dir: Path = None,
+              **wizard_options) -> list:
+    """Generate every app in the manifest across a process pool.
+
+    Extra keyword arguments (update, reproducible, ...) are passed to FlaskWizard.
+    """
+    configs, invalid = load_manifest(manifest_path)
+    output_dir = str(output_dir or '.')
+    print(f"🧙‍♂️ Generating {len(configs)} app(s) from {manifest_path}")
+
+    results = []
+    for result in invalid:
+        results.append(result)
+        print(f"❌ {result['app_name']}: {result['error']}")
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(_generate_one, config, output_dir, wizard_options) for config in configs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            if result['ok']:
+                print(f"✅ {result['app_name']} ({result['seconds']}s) -> {result['path']}")
+                for relative_path in result['conflicts']:
+                    print(f"   Skipped (edited by hand): {relative_path}")
+            else:
+                print(f"❌ {result['app_name']}: {result['error']}")
+
+    failed = [result for result in results if not result['ok']]
+    print(f"\n{len(results) - len(failed)} succeeded, {len(failed)} failed")
+    return results
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Generator Benchmark
+Measures app generation time and peak memory across the feature matrix and
+across navigation sizes, and records a JSON report that can be diffed between releases.
+
+Usage:
+    python benchmarks/bench_generator.py [--repeat 5] [--nav-sizes 1,10,100,1000,5000] [--output FILE]
+
+Generation is measured in memory (FlaskWizard.build_plan with the cache off);
+commit_ms additionally times writing the plan into a temporary directory.
+"""
+
+import io
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import itertools
+import contextlib
+import statistics
+import tempfile
+import tracemalloc
+from pathlib import Path
+from datetime import datetime, timezone
+
+WIZARD_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(WIZARD_DIR))
+
+from main_wizard import FlaskWizard  # noqa: E402
+from batch_mode import normalize_config, FEATURE_KEYS  # noqa: E402
+
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / 'results' / 'generator.json'
+DATABASES = ('sqlite', 'postgres_ready')
+DEFAULT_NAV_SIZES = (1, 10, 100, 1000, 5000)
+
+
+def make_config(database: str, features: tuple, nav_size: int = 2) -> dict:
+    """Benchmark config with the given database, enabled features and nav item count."""
+    nav_items = [{"name": "Dashboard", "route": "/", "icon": "home"}]
+    nav_items += [{"name": f"Page {i}", "route": f"/page-{i}", "icon": "circle"} for i in range(1, nav_size)]
+    return normalize_config({
+        'app_name': 'bench-app',
+        'generated_at': '2024-01-01T00:00:00',
+        'nav_items': nav_items,
+        'features': {'database': database, **{key: key in features for key in FEATURE_KEYS}},
+    })
+
+
+def measure(config: dict, repeat: int) -> dict:
+    """Median generation/commit time and peak traced memory for one config."""
+    generate_ms, commit_ms = [], []
+    for _ in range(repeat):
+        wizard = FlaskWizard(config=dict(config), use_cache=False)
+        started = time.perf_counter()
+        plan = wizard.build_plan()
+        generate_ms.append((time.perf_counter() - started) * 1000)
+
+        target = Path(tempfile.mkdtemp(prefix='wizard-bench-'))
+        try:
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):  # Silence the per-app progress line
+                plan.commit(target / 'app')
+            commit_ms.append((time.perf_counter() - started) * 1000)
+        finally:
+            shutil.rmtree(target)
+
+    tracemalloc.start()
+    FlaskWizard(config=dict(config), use_cache=False).build_plan()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        'generate_ms': round(statistics.median(generate_ms), 3),
+        'commit_ms': round(statistics.median(commit_ms), 3),
+        'peak_kib': round(peak / 1024, 1),
+        'files': len(plan.files),
+        'bytes': plan.total_bytes(),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--nav-sizes', default=','.join(map(str, DEFAULT_NAV_SIZES)),
+                        help="Comma-separated nav item counts for the scaling sweep")
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    args = parser.parse_args(argv)
+    nav_sizes = [int(size) for size in args.nav_sizes.split(',')]
+
+    report = {
+        'benchmark': 'generator',
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'repeat': args.repeat,
+        'feature_matrix': [],
+        'nav_scaling': [],
+    }
+
+    measure(make_config('sqlite', ()), 1)  # Warm up imports and the template environment
+
+    for database in DATABASES:
+        for size in range(len(FEATURE_KEYS) + 1):
+            for features in itertools.combinations(FEATURE_KEYS, size):
+                result = measure(make_config(database, features), args.repeat)
+                report['feature_matrix'].append({'database': database, 'features': list(features), **result})
+                print(f"{database:15} {'+'.join(features) or '(none)':55} "
+                      f"{result['generate_ms']:8.2f} ms {result['peak_kib']:9.1f} KiB")
+
+    for nav_size in nav_sizes:
+        result = measure(make_config('sqlite', FEATURE_KEYS, nav_size), args.repeat)
+        report['nav_scaling'].append({'nav_items': nav_size, **result})
+        print(f"nav_items={nav_size:<6} generate {result['generate_ms']:9.2f} ms  "
+              f"commit {result['commit_ms']:9.2f} ms  peak {result['peak_kib']:9.1f} KiB")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Report written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Startup Benchmark
+Measures wizard startup cost with ``python -X importtime`` and records a JSON report.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 7] [--output FILE] [--baseline FILE]
+
+With --baseline the run is compared against an earlier report and exits
+non-zero when any scenario's import time regressed beyond --tolerance.
+"""
+
+import sys
+import json
+import time
+import platform
+import argparse
+import statistics
+import subprocess
+from pathlib import Path
+from datetime import datetime, timezone
+
+WIZARD_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_OUTPUT = Path(__file__).resolve().parent / 'results' / 'startup.json'
+
+# name -> interpreter arguments, run from the wizard directory
+SCENARIOS = {
+    'cli_help': ['main_wizard.py', '--help'],
+    'import_main_wizard': ['-c', 'import main_wizard'],
+    'import_batch_mode': ['-c', 'import batch_mode'],
+    # Paid only when a stage actually needs it; tracked to spot heavier dependencies
+    'import_wizard_prompts': ['-c', 'import wizard_prompts'],
+    'import_generators': ['-c', 'import app_generator.core, app_generator.rendering; '
+                                'app_generator.rendering.get_environment()'],
+}
+
+
+def parse_importtime(stderr: str) -> list:
+    """Parse -X importtime output into (module, self_us, cumulative_us, depth) rows."""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        depth = (len(name) - len(name.lstrip(' '))) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def run_scenario(args: list, runs: int) -> dict:
+    """Run one scenario several times and summarise wall and import time."""
+    wall_ms, import_us, rows = [], [], []
+    for _ in range(runs):
+        started = time.perf_counter()
+        proc = subprocess.run([sys.executable, '-X', 'importtime', *args], cwd=WIZARD_DIR,
+                              capture_output=True, text=True)
+        wall_ms.append((time.perf_counter() - started) * 1000)
+        if proc.returncode != 0:
+            raise RuntimeError(f"{' '.join(args)} failed:\n{proc.stderr[-2000:]}")
+        rows = parse_importtime(proc.stderr)
+        import_us.append(sum(cumulative for _, _, cumulative, depth in rows if depth == 0))
+
+    top_level = sorted((row for row in rows if row[3] == 0), key=lambda row: row[2], reverse=True)
+    return {
+        'wall_ms_median': round(statistics.median(wall_ms), 2),
+        'wall_ms_min': round(min(wall_ms), 2),
+        'import_us_median': int(statistics.median(import_us)),
+        'modules_imported': len(rows),
+        'top_imports': [{'module': name, 'cumulative_us': cumulative}
+                        for name, _, cumulative, _ in top_level[:10]],
+    }
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """Return a description of every scenario whose import time regressed."""
+    regressions = []
+    for name, result in report['scenarios'].items():
+        previous = baseline.get('scenarios', {}).get(name)
+        if not previous:
+            continue
+        before, after = previous['import_us_median'], result['import_us_median']
+        change = (after - before) / before if before else 0.0
+        print(f"{name:24} {before:>9} us -> {after:>9} us ({change:+.1%})")
+        if change > tolerance:
+            regressions.append(f"{name}: import time {change:+.1%}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    parser.add_argument('--runs', type=int, default=7)
+    parser.add_argument('--output', type=Path, default=DEFAULT_OUTPUT)
+    parser.add_argument('--baseline', type=Path, help="Earlier report to compare against")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="Allowed fractional import-time increase before failing (default: 0.25)")
+    args = parser.parse_args(argv)
+
+    report = {
+        'benchmark': 'startup',
+        'recorded_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': args.runs,
+        'scenarios': {},
+    }
+    for name, scenario_args in SCENARIOS.items():
+        report['scenarios'][name] = result = run_scenario(scenario_args, args.runs)
+        print(f"{name:24} wall {result['wall_ms_median']:8.1f} ms  imports {result['import_us_median']:>9} us")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+    print(f"Report written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(report, json.loads(args.baseline.read_text()), args.tolerance)
+        if regressions:
+            print("Startup regressions:\n  " + "\n  ".join(regressions))
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
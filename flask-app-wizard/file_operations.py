@@ -1,32 +1,281 @@
 """
 File Operations Module
-Provides utility functions for creating directories and writing files.
+Stages generated files in an OutputPlan and commits them to disk or an archive.
 """
 
+import io
+import os
+import sys
+import json
+import time
+import shutil
+import hashlib
+import tempfile
 from pathlib import Path
 
-def create_directory_structure(app_path: Path):
-    """Creates the necessary directory structure for the Flask application."""
-    app_path.mkdir(exist_ok=True) # Ensure base app directory exists
-
-    # Core directories
-    (app_path / "templates").mkdir(exist_ok=True)
-    (app_path / "static" / "css").mkdir(parents=True, exist_ok=True)
-    (app_path / "static" / "js").mkdir(exist_ok=True)
-    (app_path / "static" / "uploads").mkdir(exist_ok=True)
-    (app_path / "static" / "images").mkdir(exist_ok=True) # Added from paths.py
-    (app_path / "logs").mkdir(exist_ok=True)
-    (app_path / "routes").mkdir(exist_ok=True)
-    (app_path / "utils").mkdir(exist_ok=True)
-    (app_path / "data").mkdir(exist_ok=True) # Added from paths.py
-    (app_path / "data" / "backups").mkdir(exist_ok=True) # Added from paths.py
-    (app_path / "config").mkdir(exist_ok=True) # Added from paths.py
-
-    print(f"Created directory structure in {app_path}")
-
-def write_file(file_path: Path, content: str):
-    """Writes content to a specified file, creating parent directories if needed."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w") as f:
-        f.write(content)
-    print(f"Generated: {file_path}")
\ No newline at end of file
+# Directories every generated app contains, relative to the app root
+APP_DIRECTORIES = (
+    "templates",
+    "static/css",
+    "static/js",
+    "static/uploads",
+    "static/images",
+    "logs",
+    "routes",
+    "utils",
+    "data",
+    "data/backups",
+    "config",
+)
+
+# Content-hash manifest kept in every generated app for incremental updates
+MANIFEST_NAME = ".wizard-manifest.json"
+
+# Archive formats accepted by OutputPlan.write_archive(), by file suffix
+ARCHIVE_FORMATS = {'.tar.gz': 'tar.gz', '.tgz': 'tar.gz', '.tar': 'tar', '.zip': 'zip'}
+
+
+def content_hash(content: bytes) -> str:
+    """SHA-256 hex digest of file content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def _load_manifest(app_path: Path) -> dict:
+    try:
+        return json.loads((Path(app_path) / MANIFEST_NAME).read_text())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def read_manifest(app_path: Path) -> dict:
+    """Load the {relative path: content hash} manifest of a generated app."""
+    return _load_manifest(app_path).get('files', {})
+
+
+def read_generated_at(app_path: Path):
+    """The generation timestamp recorded by the last commit into app_path, or None."""
+    return _load_manifest(app_path).get('generated_at')
+
+
+def resolve_archive_format(target, archive_format: str = None) -> str:
+    """The archive format to write: archive_format if given, else from the target's suffix, else tar.gz."""
+    if archive_format is None:
+        name = str(target)
+        archive_format = next((fmt for suffix, fmt in ARCHIVE_FORMATS.items() if name.endswith(suffix)), 'tar.gz')
+    if archive_format not in ARCHIVE_FORMATS.values():
+        raise ValueError(f"Unsupported archive format: {archive_format}")
+    return archive_format
+
+
+class OutputPlan:
+    """In-memory plan of every directory and file a generation run produces.
+
+    Generators contribute content with add_file(); adding the same path twice
+    keeps only the last content. Nothing touches the disk until commit().
+    generated_at, when set, is recorded in the manifest so that an update can
+    regenerate with the same timestamp.
+    """
+
+    def __init__(self):
+        self.files = {}          # relative posix path -> bytes
+        self.directories = set()
+        self.generated_at = None
+
+    def add_directory(self, relative_path: str):
+        """Plan an (possibly empty) directory relative to the app root."""
+        self.directories.add(Path(relative_path).as_posix())
+
+    def add_file(self, relative_path: str, content):
+        """Plan a file relative to the app root, replacing any earlier content."""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        self.files[Path(relative_path).as_posix()] = content
+
+    def total_bytes(self) -> int:
+        """Total size of all planned file contents."""
+        return sum(len(content) for content in self.files.values())
+
+    def _all_directories(self) -> list:
+        """Every directory needed by the plan, parents before children."""
+        needed = set()
+        for relative_path in list(self.directories) + [str(Path(f).parent) for f in self.files]:
+            path = Path(relative_path)
+            while str(path) not in ('.', ''):
+                needed.add(path.as_posix())
+                path = path.parent
+        return sorted(needed, key=lambda p: (p.count('/'), p))
+
+    def _write_tree(self, root: Path, files: dict, profiler=None):
+        """Write files below root, creating each directory exactly once."""
+        for relative_dir in self._all_directories():
+            (root / relative_dir).mkdir(exist_ok=True)
+        for relative_path, content in files.items():
+            started = time.perf_counter()
+            with open(root / relative_path, "wb") as f:
+                f.write(content)
+            if profiler:
+                profiler.record_write(relative_path, time.perf_counter() - started, len(content))
+
+    def _manifest_bytes(self, hashes: dict) -> bytes:
+        manifest = {'version': 1, 'files': dict(sorted(hashes.items()))}
+        if self.generated_at is not None:
+            manifest['generated_at'] = self.generated_at
+        return json.dumps(manifest, indent=2).encode('utf-8')
+
+    def _plan_update(self, app_path: Path, update: bool) -> dict:
+        """Decide which planned files to write into app_path.
+
+        Without update every file is written. With update, files whose bytes are
+        unchanged are skipped, and files edited by hand since the last generation
+        (their hash no longer matches the manifest) are reported, not overwritten.
+        """
+        hashes = {path: content_hash(content) for path, content in self.files.items()}
+        report = {'written': [], 'unchanged': [], 'conflicts': [], 'hashes': hashes}
+        previous = read_manifest(app_path) if update else {}
+
+        for relative_path, new_hash in list(hashes.items()):
+            target = app_path / relative_path
+            if not update or not target.is_file():
+                report['written'].append(relative_path)
+                continue
+            current_hash = content_hash(target.read_bytes())
+            if current_hash == new_hash:
+                report['unchanged'].append(relative_path)
+            elif previous.get(relative_path) == current_hash:
+                report['written'].append(relative_path)
+            else:
+                report['conflicts'].append(relative_path)
+                if relative_path in previous:
+                    hashes[relative_path] = previous[relative_path]
+                else:
+                    del hashes[relative_path]
+        return report
+
+    def commit(self, app_path: Path, update: bool = False, profiler=None) -> dict:
+        """Write the plan to app_path through a temporary staging directory.
+
+        A new app is staged next to app_path and renamed into place in one step,
+        so a crash never leaves a half-written tree. For an existing app each
+        staged file replaces its target atomically and unplanned files are kept.
+        With update=True only files whose generated bytes changed are rewritten.
+        Returns a report listing written, unchanged and conflicting paths.
+        A GenerationProfiler passed as profiler records every file write.
+        """
+        app_path = Path(app_path)
+        app_path.parent.mkdir(parents=True, exist_ok=True)
+        report = self._plan_update(app_path, update and app_path.exists())
+
+        files = {path: self.files[path] for path in report['written']}
+        manifest = self._manifest_bytes(report['hashes'])
+        manifest_path = app_path / MANIFEST_NAME
+        if not manifest_path.is_file() or manifest_path.read_bytes() != manifest:
+            files[MANIFEST_NAME] = manifest
+
+        staging = Path(tempfile.mkdtemp(prefix=f".{app_path.name}-", dir=app_path.parent))
+        try:
+            self._write_tree(staging, files, profiler)
+            if not app_path.exists():
+                umask = os.umask(0)
+                os.umask(umask)
+                staging.chmod(0o777 & ~umask)  # mkdtemp creates the directory 0700
+                staging.rename(app_path)
+            else:
+                for relative_dir in self._all_directories():
+                    (app_path / relative_dir).mkdir(exist_ok=True)
+                for relative_path in files:
+                    os.replace(staging / relative_path, app_path / relative_path)
+        finally:
+            if staging.exists():
+                shutil.rmtree(staging)
+
+        print(f"Generated {len(report['written'])} files in {app_path}"
+              + (f" ({len(report['unchanged'])} unchanged)" if report['unchanged'] else ""))
+        for relative_path in report['conflicts']:
+            print(f"Skipped (edited by hand): {app_path / relative_path}")
+        return report
+
+    def write_archive(self, target, root_name: str, archive_format: str = None,
+                      mtime: float = None, profiler=None) -> int:
+        """Stream the plan into a tar, tar.gz or zip archive without touching the filesystem.
+
+        target is a path, '-' for stdout, or a writable binary stream. Every entry
+        is placed below root_name/ and stamped with mtime (default: now), and
+        entries are written in sorted order, so a pinned mtime gives a
+        byte-identical archive. Returns the number of bytes of file content written.
+        """
+        archive_format = resolve_archive_format(target, archive_format)
+        mtime = time.time() if mtime is None else mtime
+
+        files = dict(self.files)
+        files[MANIFEST_NAME] = self._manifest_bytes({path: content_hash(content) for path, content in self.files.items()})
+        entries = [(f"{root_name}/{relative_dir}/", None) for relative_dir in self._all_directories()]
+        entries += [(f"{root_name}/{relative_path}", files[relative_path]) for relative_path in sorted(files)]
+        entries.insert(0, (f"{root_name}/", None))
+
+        if target == '-':
+            stream, close_stream = sys.__stdout__.buffer, False
+        elif hasattr(target, 'write'):
+            stream, close_stream = target, False
+        else:
+            Path(target).parent.mkdir(parents=True, exist_ok=True)
+            stream, close_stream = open(target, 'wb'), True
+
+        try:
+            if archive_format == 'zip':
+                self._write_zip(stream, entries, mtime, profiler)
+            else:
+                self._write_tar(stream, entries, mtime, archive_format == 'tar.gz', profiler)
+            stream.flush()
+        finally:
+            if close_stream:
+                stream.close()
+
+        if target == '-':
+            print(f"Archived {len(files)} files to stdout", file=sys.stderr)
+        else:
+            print(f"Archived {len(files)} files to {target}")
+        return sum(len(content) for content in files.values())
+
+    @staticmethod
+    def _write_tar(stream, entries: list, mtime: float, compress: bool, profiler=None):
+        import gzip
+        import tarfile
+
+        # Own GzipFile so the gzip header carries mtime rather than the current time
+        gz = gzip.GzipFile(filename='', mode='wb', fileobj=stream, mtime=int(mtime)) if compress else None
+        with tarfile.open(fileobj=gz or stream, mode='w|', format=tarfile.PAX_FORMAT) as tar:
+            for name, content in entries:
+                started = time.perf_counter()
+                info = tarfile.TarInfo(name.rstrip('/'))
+                info.mtime = int(mtime)
+                if content is None:
+                    info.type, info.mode = tarfile.DIRTYPE, 0o755
+                    tar.addfile(info)
+                    continue
+                info.mode, info.size = 0o644, len(content)
+                tar.addfile(info, io.BytesIO(content))
+                if profiler:
+                    profiler.record_write(name, time.perf_counter() - started, len(content))
+        if gz:
+            gz.close()
+
+    @staticmethod
+    def _write_zip(stream, entries: list, mtime: float, profiler=None):
+        import zipfile
+
+        # ZIP timestamps cannot predate 1980
+        date_time = max(time.gmtime(mtime)[:6], (1980, 1, 1, 0, 0, 0))
+        with zipfile.ZipFile(stream, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for name, content in entries:
+                started = time.perf_counter()
+                info = zipfile.ZipInfo(name, date_time=date_time)
+                if content is None:
+                    info.external_attr = (0o40755 << 16) | 0x10
+                    archive.writestr(info, b'')
+                    continue
+                info.external_attr = 0o100644 << 16
+                info.compress_type = zipfile.ZIP_DEFLATED
+                archive.writestr(info, content)
+                if profiler:
+                    profiler.record_write(name, time.perf_counter() - started, len(content))
+
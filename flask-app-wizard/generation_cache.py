@@ -0,0 +1,81 @@
+"""
+Generation Cache Module
+Content-addressed on-disk cache of whole generated app trees, keyed by a
+canonical hash of the wizard configuration and the generator sources.
+"""
+
+import os
+import json
+import shutil
+import hashlib
+import tempfile
+from pathlib import Path
+from functools import lru_cache
+
+from file_operations import OutputPlan
+from app_generator.rendering import SKELETON_DIR, template_search_path
+
+CACHE_DIR = Path(os.environ.get('FLASK_WIZARD_CACHE_DIR', Path.home() / '.cache' / 'flask-wizard'))
+GENERATOR_DIR = Path(__file__).parent / 'app_generator'
+INDEX_NAME = 'index.json'
+
+
+@lru_cache(maxsize=None)
+def generator_fingerprint() -> str:
+    """Hash of every generator source and template, so editing either invalidates the cache."""
+    digest = hashlib.sha256()
+    roots = [GENERATOR_DIR] + [path for path in template_search_path() if path != SKELETON_DIR]
+    for root in roots:
+        for source in sorted(p for p in root.rglob('*') if p.is_file() and p.suffix != '.pyc'):
+            digest.update(source.relative_to(root).as_posix().encode('utf-8'))
+            digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def config_key(config: dict) -> str:
+    """Canonical hash of a configuration plus the generator sources."""
+    canonical = json.dumps({'config': config, 'generator': generator_fingerprint()},
+                           sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _entry_path(key: str) -> Path:
+    return CACHE_DIR / key[:2] / key
+
+
+def load_plan(key: str):
+    """Return the cached OutputPlan for key, or None on a cache miss."""
+    entry = _entry_path(key)
+    try:
+        index = json.loads((entry / INDEX_NAME).read_text())
+        plan = OutputPlan()
+        for relative_dir in index['directories']:
+            plan.add_directory(relative_dir)
+        for relative_path in index['files']:
+            plan.add_file(relative_path, (entry / 'tree' / relative_path).read_bytes())
+    except (OSError, ValueError, KeyError):
+        return None
+    return plan
+
+
+def store_plan(key: str, plan: OutputPlan):
+    """Store a generated plan under key; concurrent writers of the same key are harmless."""
+    entry = _entry_path(key)
+    if entry.exists():
+        return
+    entry.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{key[:12]}-", dir=entry.parent))
+    try:
+        tree = staging / 'tree'
+        for relative_path, content in plan.files.items():
+            target = tree / relative_path
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(content)
+        index = {'directories': sorted(plan.directories), 'files': sorted(plan.files)}
+        (staging / INDEX_NAME).write_text(json.dumps(index, indent=2))
+        staging.rename(entry)
+    except OSError:
+        pass  # Another process stored the same key first, or the cache is read-only
+    finally:
+        if staging.exists():
+            shutil.rmtree(staging, ignore_errors=True)
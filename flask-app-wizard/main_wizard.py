@@ -5,38 +5,46 @@ This script guides the user through creating a new Flask application,
 gathering configuration, and then generating the project files.
 """
 
-print("DEBUG: Script started.") 
-
+import os
 import sys
-import json
+import argparse
 from pathlib import Path
 from datetime import datetime
+from contextlib import nullcontext
 
-# Import modules for different wizard stages
-from wizard_prompts import gather_basic_info, gather_nav_info, gather_features, confirm_config
-from file_operations import create_directory_structure, write_file
-
-# Import functions from app_generator package
-from app_generator.core import generate_main_app_content, generate_paths_file_content
-from app_generator.routes import generate_routes_init_content, generate_main_routes_content, generate_api_routes_content
-from app_generator.templates import generate_base_template_content, generate_dashboard_template_content, generate_nav_templates_content, generate_error_template_content
-from app_generator.utils import generate_utils_init_content, generate_database_utils_content, generate_helpers_utils_content, generate_validators_utils_content
-from app_generator.static import generate_custom_css_content, generate_app_js_content
-from app_generator.misc import generate_requirements_content, generate_readme_content, generate_env_content, generate_settings_content  
-
+from file_operations import APP_DIRECTORIES, OutputPlan, read_generated_at, resolve_archive_format
 
+# The prompt (questionary/prompt_toolkit) and generator (jinja2) modules are
+# imported inside the stages that need them, so --manifest, --help and cache
+# hits never pay for loading them. benchmarks/bench_startup.py tracks this.
 
-print("DEBUG: All imports complete.")
+# Default timestamp for --reproducible; the earliest date a ZIP entry can record
+REPRODUCIBLE_TIMESTAMP = "1980-01-01T00:00:00"
 
 class FlaskWizard:
-    def __init__(self):
-        self.config = {}
+    def __init__(self, config: dict = None, output_dir: Path = None, update: bool = False,
+                 reproducible: bool = False, use_cache: bool = True,
+                 profile: Path = None, cprofile: Path = None,
+                 archive=None, archive_format: str = None):
+        # A copy: build_plan() pins generated_at, which must not leak into the caller's dict
+        self.config = dict(config or {})
+        self.output_dir = Path(output_dir) if output_dir else Path('.')
+        self.update = update
+        self.reproducible = reproducible
+        self.use_cache = use_cache
+        self.archive = archive
+        self.archive_format = archive_format
+        self.profile_path = Path(profile) if profile else None
+        self.profiler = None
+        if profile or cprofile:
+            from profiling import GenerationProfiler
+            self.profiler = GenerationProfiler(cprofile_path=cprofile)
         self.app_output_path = None
-        print("DEBUG: FlaskWizard instance initialized.")
 
     def run(self):
         """Main wizard flow for generating a Flask application."""
-        print("DEBUG: Entering FlaskWizard.run() method.")
+        from wizard_prompts import gather_basic_info, gather_nav_info, gather_features, confirm_config
+
         print("🧙‍♂️ Flask App Generator Wizard")
         print("=" * 40)
 
@@ -57,7 +65,8 @@ class FlaskWizard:
             'user_auth': features_dict.get('user_auth', False),
             'file_uploads': features_dict.get('file_uploads', False),
             'api_endpoints': features_dict.get('api_endpoints', False),
-            'background_tasks': features_dict.get('background_tasks', False)
+            'background_tasks': features_dict.get('background_tasks', False),
+            'metrics': features_dict.get('metrics', False)
         }
         # --- END OF ROBUST FEATURES PROCESSING BLOCK ---
 
@@ -71,60 +80,229 @@ class FlaskWizard:
         self.generate_app()
 
         print(f"\n✅ Flask app '{self.config['app_name']}' created successfully!")
-        print(f"📁 Location: {self.app_output_path.resolve()}")
+        if self.archive:
+            self._print_archive_instructions()
+        else:
+            print(f"📁 Location: {self.app_output_path.resolve()}")
         print(f"🚀 To run: cd {self.config['app_name']} && python app.py")
         print("\nDon't forget to create and activate a virtual environment!")
         print("Example: python3 -m venv venv && source venv/bin/activate && pip install -r requirements.txt")
 
 
-    def generate_app(self):
-        """Generates the complete Flask application structure and files based on configuration."""
-        print("DEBUG: Entering generate_app().")
-        self.app_output_path = Path(self.config['app_name'])
-        create_directory_structure(self.app_output_path)
+    def _print_archive_instructions(self):
+        """Tells the user where the archive went and how to unpack it."""
+        archive_format = resolve_archive_format(self.archive, self.archive_format)
+        if self.archive == '-':
+            print("📦 Archive: written to stdout")
+            if archive_format == 'zip':
+                print("📂 To unpack: save it to a file and run unzip <file>")
+            else:
+                print(f"📂 To unpack: pipe it into tar -x{'z' if archive_format == 'tar.gz' else ''}f -")
+            return
+        archive_path = Path(self.archive).resolve()
+        print(f"📦 Archive: {archive_path}")
+        if archive_format == 'zip':
+            print(f"📂 To unpack: unzip {archive_path}")
+        else:
+            print(f"📂 To unpack: tar -x{'z' if archive_format == 'tar.gz' else ''}f {archive_path}")
+
+    def build_plan(self) -> OutputPlan:
+        """Returns the output plan for the configuration, reusing the generation cache when possible.
+
+        Output is only reproducible, and therefore cacheable, once the generation
+        timestamp is pinned via config['generated_at'], SOURCE_DATE_EPOCH or --reproducible.
+        An update reuses the timestamp of the previous generation, so an unchanged
+        configuration does not rewrite app.py just for its "Generated:" header.
+        """
+        if 'generated_at' not in self.config:
+            if os.environ.get('SOURCE_DATE_EPOCH'):
+                self.config['generated_at'] = int(os.environ['SOURCE_DATE_EPOCH'])
+            elif self.reproducible:
+                self.config['generated_at'] = REPRODUCIBLE_TIMESTAMP
+            elif self.update and not self.archive:
+                previous = read_generated_at(self.output_dir / self.config['app_name'])
+                if previous is not None:
+                    self.config['generated_at'] = previous
+        if 'generated_at' not in self.config or not self.use_cache:
+            self._note('cache', 'disabled')
+            # Pinned here so the manifest records the timestamp app.py was rendered with
+            self.config.setdefault('generated_at', datetime.now().isoformat(timespec='seconds'))
+            with self._stage('generate'):
+                plan = self._generate_plan()
+            plan.generated_at = self.config['generated_at']
+            return plan
+
+        import generation_cache
+        with self._stage('cache_lookup'):
+            key = generation_cache.config_key(self.config)
+            plan = generation_cache.load_plan(key)
+        self._note('cache', 'miss' if plan is None else 'hit')
+        if plan is None:
+            with self._stage('generate'):
+                plan = self._generate_plan()
+            with self._stage('cache_store'):
+                generation_cache.store_plan(key, plan)
+        plan.generated_at = self.config['generated_at']
+        return plan
+
+    def _stage(self, name: str):
+        """Times a stage when profiling, otherwise a no-op context."""
+        if self.profiler:
+            return self.profiler.stage(name)
+        return nullcontext()
+
+    def _note(self, key: str, value):
+        """Adds a field to the profile report when profiling."""
+        if self.profiler:
+            self.profiler.notes[key] = value
+
+    def _run(self, generator, *args):
+        """Calls a generator function, timing it when profiling."""
+        if self.profiler:
+            return self.profiler.call(generator, *args)
+        return generator(*args)
+
+    def _generate_plan(self) -> OutputPlan:
+        """Runs every generator and collects their output into an in-memory output plan."""
+        # Imported here rather than at module level; see the note at the top of the file
+        with self._stage('load_generators'):
+            from app_generator.core import generate_main_app_content, generate_paths_file_content
+            from app_generator.routes import assign_nav_endpoints, generate_routes_init_content, generate_main_routes_content, generate_api_routes_content, generate_health_routes_content
+            from app_generator.templates import generate_base_template_content, generate_dashboard_template_content, generate_nav_templates_content, generate_error_template_content
+            from app_generator.utils import generate_utils_init_content, generate_database_utils_content, generate_activity_log_utils_content, generate_assets_utils_content, generate_response_cache_utils_content, generate_health_utils_content, generate_logging_setup_utils_content, generate_metrics_utils_content, generate_profiler_utils_content, generate_helpers_utils_content, generate_validators_utils_content
+            from app_generator.static import generate_custom_css_content, generate_app_js_content, generate_build_assets_content
+            from app_generator.misc import generate_requirements_content, generate_readme_content, generate_env_content, generate_settings_content, generate_gunicorn_conf_content
+            from app_generator.rendering import get_environment, normalize_features
+            get_environment()  # Build the Jinja2 environment now so the first generator is not charged for it
+
+        run = self._run
+        # Endpoint names are derived once here and shared by every generator that needs them
+        config = {**self.config, 'nav_items': assign_nav_endpoints(self.config['nav_items'])}
+        plan = OutputPlan()
+        for relative_dir in APP_DIRECTORIES:
+            plan.add_directory(relative_dir)
 
         # Generate core application files
-        write_file(self.app_output_path / "paths.py", generate_paths_file_content(self.config))
-        write_file(self.app_output_path / "app.py", generate_main_app_content(self.config))
-        write_file(self.app_output_path / ".env", generate_env_content(self.config))
-        write_file(self.app_output_path / "requirements.txt", generate_requirements_content(self.config))
-        write_file(self.app_output_path / "README.md", generate_readme_content(self.config))
-        write_file(self.app_output_path / "settings.py", generate_settings_content(self.config))
+        plan.add_file("paths.py", run(generate_paths_file_content, config))
+        plan.add_file("app.py", run(generate_main_app_content, config))
+        plan.add_file(".env", run(generate_env_content, config))
+        plan.add_file("requirements.txt", run(generate_requirements_content, config))
+        plan.add_file("README.md", run(generate_readme_content, config))
+        plan.add_file("settings.py", run(generate_settings_content, config))
+        plan.add_file("gunicorn.conf.py", run(generate_gunicorn_conf_content, config))
 
         # Generate Route files
-        write_file(self.app_output_path / "routes" / "__init__.py", generate_routes_init_content())
-        write_file(self.app_output_path / "routes" / "main.py", generate_main_routes_content(self.config))
-        # API routes are optional, generate only if API endpoints feature is selected
-        if self.config['features']['api_endpoints']:
-            write_file(self.app_output_path / "routes" / "api.py", generate_api_routes_content(self.config))
-        else:
-            # If API is not chosen, ensure api.py is minimal or not generated
-            write_file(self.app_output_path / "routes" / "api.py", "# API routes (feature not enabled)\nfrom flask import Blueprint\napi_bp = Blueprint('api', __name__, url_prefix='/api')\n")
-
+        plan.add_file("routes/__init__.py", run(generate_routes_init_content))
+        plan.add_file("routes/main.py", run(generate_main_routes_content, config))
+        # API routes are optional; without the feature api.py is a minimal stub
+        plan.add_file("routes/api.py", run(generate_api_routes_content, config))
+        plan.add_file("routes/health.py", run(generate_health_routes_content))
 
         # Generate Utility files
-        write_file(self.app_output_path / "utils" / "__init__.py", generate_utils_init_content())
-        write_file(self.app_output_path / "utils" / "database.py", generate_database_utils_content(self.config))
-        write_file(self.app_output_path / "utils" / "helpers.py", generate_helpers_utils_content())
-        write_file(self.app_output_path / "utils" / "validators.py", generate_validators_utils_content())
+        plan.add_file("utils/__init__.py", run(generate_utils_init_content))
+        plan.add_file("utils/database.py", run(generate_database_utils_content, config))
+        plan.add_file("utils/activity_log.py", run(generate_activity_log_utils_content))
+        plan.add_file("utils/assets.py", run(generate_assets_utils_content))
+        plan.add_file("utils/response_cache.py", run(generate_response_cache_utils_content))
+        plan.add_file("utils/health.py", run(generate_health_utils_content, config))
+        plan.add_file("utils/logging_setup.py", run(generate_logging_setup_utils_content))
+        if normalize_features(config)['metrics']:
+            plan.add_file("utils/metrics.py", run(generate_metrics_utils_content))
+        plan.add_file("utils/profiler.py", run(generate_profiler_utils_content))
+        plan.add_file("utils/helpers.py", run(generate_helpers_utils_content))
+        plan.add_file("utils/validators.py", run(generate_validators_utils_content))
 
         # Generate Template files
-        write_file(self.app_output_path / "templates" / "base.html", generate_base_template_content(self.config))
-        write_file(self.app_output_path / "templates" / "dashboard.html", generate_dashboard_template_content(self.config))
-        write_file(self.app_output_path / "templates" / "error.html", generate_error_template_content())
-        # This function handles creating multiple navigation-related template files
-        generate_nav_templates_content(self.app_output_path, self.config['nav_items'])
+        plan.add_file("templates/base.html", run(generate_base_template_content, config))
+        plan.add_file("templates/dashboard.html", run(generate_dashboard_template_content, config))
+        plan.add_file("templates/error.html", run(generate_error_template_content))
+        # One template per navigation item
+        for template_name, content in run(generate_nav_templates_content, config['nav_items']).items():
+            plan.add_file(f"templates/{template_name}", content)
 
         # Generate Static files
-        write_file(self.app_output_path / "static" / "css" / "custom.css", generate_custom_css_content(self.config))
-        write_file(self.app_output_path / "static" / "js" / "app.js", generate_app_js_content(self.config))
-        # Add this line with your other core application files
-        write_file(self.app_output_path / "settings.py", generate_settings_content(self.config))
+        plan.add_file("static/css/custom.css", run(generate_custom_css_content, config))
+        plan.add_file("static/js/app.js", run(generate_app_js_content, config))
+        plan.add_file("build_assets.py", run(generate_build_assets_content, config))
+        return plan
+
+    def generate_app(self):
+        """Generates the complete Flask application structure and files based on configuration.
+
+        With an archive target the files are streamed into a tar/zip archive
+        (or stdout) instead of being written to the output directory.
+        """
+        self.app_output_path = self.output_dir / self.config['app_name']
+        if self.profiler:
+            self.profiler.notes['app_name'] = self.config['app_name']
+            self.profiler.start()
+        try:
+            plan = self.build_plan()
+            with self._stage('archive' if self.archive else 'commit'):
+                if self.archive:
+                    return plan.write_archive(self.archive, self.config['app_name'], self.archive_format,
+                                              mtime=self._archive_mtime(), profiler=self.profiler)
+                return plan.commit(self.app_output_path, update=self.update, profiler=self.profiler)
+        finally:
+            if self.profiler:
+                self.profiler.stop()
+                if self.profile_path:
+                    self.profiler.write(self.profile_path)
+
+    def _archive_mtime(self) -> float:
+        """Archive entry timestamp: the generation time, read as UTC when it has no zone."""
+        from datetime import timezone
+        from app_generator.core import get_generation_time
+        generated = get_generation_time(self.config)
+        if generated.tzinfo is None:
+            generated = generated.replace(tzinfo=timezone.utc)
+        return generated.timestamp()
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Flask App Generator Wizard")
+    parser.add_argument('--manifest', type=Path,
+                        help="Generate every app in a JSON/TOML manifest without prompting")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes for --manifest (default: CPU count)")
+    parser.add_argument('--output-dir', type=Path, default=None,
+                        help="Directory to create apps in (default: current directory)")
+    parser.add_argument('--update', action='store_true',
+                        help="Only rewrite files whose generated content changed; keep files edited by hand")
+    parser.add_argument('--reproducible', action='store_true',
+                        help="Pin the generation timestamp so identical configs produce identical files")
+    parser.add_argument('--no-cache', dest='use_cache', action='store_false',
+                        help="Always run the generators instead of reusing the generation cache")
+    parser.add_argument('--profile', type=Path, default=None,
+                        help="Write a JSON report timing each generator, stage and file write")
+    parser.add_argument('--cprofile', type=Path, default=None,
+                        help="Also dump cProfile statistics of the generation to this file")
+    parser.add_argument('--archive', default=None,
+                        help="Stream the app into a .tar.gz/.tar/.zip file instead of a directory; '-' for stdout "
+                             "(with --manifest: a directory receiving one archive per app)")
+    parser.add_argument('--archive-format', choices=['tar.gz', 'tar', 'zip'], default=None,
+                        help="Archive format (default: from the --archive suffix, else tar.gz)")
+    return parser.parse_args(argv)
 
 
 if __name__ == '__main__':
-    print("DEBUG: Entering __name__ == '__main__' block.")
-    wizard = FlaskWizard()
+    args = parse_args()
+    wizard_options = dict(update=args.update, reproducible=args.reproducible, use_cache=args.use_cache,
+                          profile=args.profile, cprofile=args.cprofile,
+                          archive=args.archive, archive_format=args.archive_format)
+    if args.archive == '-':
+        if args.manifest:
+            sys.exit("--archive - (stdout) cannot be combined with --manifest")
+        # Keep stdout for the archive bytes; progress messages go to stderr
+        sys.stdout = sys.stderr
+    if args.manifest:
+        from batch_mode import run_batch
+        results = run_batch(args.manifest, workers=args.workers, output_dir=args.output_dir,
+                            **wizard_options)
+        sys.exit(0 if all(result['ok'] for result in results) else 1)
+
+    wizard = FlaskWizard(output_dir=args.output_dir, **wizard_options)
     try:
         wizard.run()
     except Exception as e:
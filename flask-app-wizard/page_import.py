@@ -0,0 +1,54 @@
+"""
+Page Import Module
+Loads navigation pages in bulk from a CSV or JSON sitemap.
+
+CSV files need a header row with a ``name`` column and optional ``route`` and
+``icon`` columns. JSON files hold a list of {"name", "route", "icon"} objects,
+or a mapping with such a list under "pages". Routes the generated app serves
+itself (/api/..., /livez, ...) are rejected.
+"""
+
+import csv
+import json
+from pathlib import Path
+
+from app_generator.routes import check_nav_route
+
+DEFAULT_ICON = "circle"
+
+
+def _page_from_row(row: dict, source: str) -> dict:
+    name = (row.get('name') or '').strip()
+    if not name:
+        raise ValueError(f"{source}: page name cannot be empty")
+    route = (row.get('route') or '').strip() or f"/{name.lower().replace(' ', '-')}"
+    if not route.startswith('/'):
+        route = '/' + route
+    page = {"name": name, "route": route, "icon": (row.get('icon') or '').strip() or DEFAULT_ICON}
+    try:
+        check_nav_route(page)
+    except ValueError as e:
+        raise ValueError(f"{source}: {e}") from None
+    return page
+
+
+def load_pages(pages_path: Path) -> list:
+    """Read nav items from a CSV or JSON sitemap, in file order."""
+    pages_path = Path(pages_path)
+    if pages_path.suffix.lower() == '.csv':
+        with open(pages_path, newline='', encoding='utf-8-sig') as f:
+            rows = list(csv.DictReader(f))
+    else:
+        data = json.loads(pages_path.read_text())
+        rows = data.get('pages') if isinstance(data, dict) else data
+        if not isinstance(rows, list):
+            raise ValueError(f"{pages_path}: expected a list of pages or a 'pages' list")
+
+    pages = [_page_from_row(row, f"{pages_path} entry {i}") for i, row in enumerate(rows, start=1)]
+
+    seen_routes = set()
+    for page in pages:
+        if page['route'] in seen_routes:
+            raise ValueError(f"{pages_path}: duplicate route {page['route']}")
+        seen_routes.add(page['route'])
+    return pages
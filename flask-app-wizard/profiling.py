@@ -0,0 +1,97 @@
+"""
+Profiling Module
+Times each generator function, stage and file write of a generation run and
+writes the result as a JSON report, optionally alongside a cProfile dump.
+"""
+
+import json
+import time
+from pathlib import Path
+from contextlib import contextmanager
+
+
+class GenerationProfiler:
+    """Collects per-generator, per-stage and per-write timings for one generation run."""
+
+    def __init__(self, cprofile_path: Path = None):
+        self.generators = {}     # generator name -> {'calls', 'seconds', 'bytes'}
+        self.stages = {}         # stage name -> seconds
+        self.writes = []         # {'path', 'seconds', 'bytes'} per written file
+        self.notes = {}
+        self.cprofile_path = Path(cprofile_path) if cprofile_path else None
+        self._profile = None
+        self._started = None
+        self._finished = None
+
+    def start(self):
+        """Start the wall clock and, if requested, cProfile."""
+        if self.cprofile_path:
+            import cProfile
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+        self._started = time.perf_counter()
+
+    def stop(self):
+        """Stop the wall clock and cProfile."""
+        self._finished = time.perf_counter()
+        if self._profile:
+            self._profile.disable()
+
+    def call(self, fn, *args):
+        """Call a generator function, recording its duration and output size."""
+        started = time.perf_counter()
+        result = fn(*args)
+        elapsed = time.perf_counter() - started
+
+        if isinstance(result, dict):
+            produced = sum(len(content.encode('utf-8')) for content in result.values())
+        else:
+            produced = len(result.encode('utf-8'))
+        stats = self.generators.setdefault(fn.__name__, {'calls': 0, 'seconds': 0.0, 'bytes': 0})
+        stats['calls'] += 1
+        stats['seconds'] += elapsed
+        stats['bytes'] += produced
+        return result
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a named stage of the run (cache lookup, generation, commit, ...)."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + time.perf_counter() - started
+
+    def record_write(self, relative_path: str, seconds: float, size: int):
+        """Record one file written to disk."""
+        self.writes.append({'path': relative_path, 'seconds': round(seconds, 6), 'bytes': size})
+
+    def report(self) -> dict:
+        """Build the JSON-serialisable report."""
+        total = (self._finished or time.perf_counter()) - (self._started or time.perf_counter())
+        generators = [
+            {'name': name, 'calls': stats['calls'], 'seconds': round(stats['seconds'], 6), 'bytes': stats['bytes']}
+            for name, stats in sorted(self.generators.items(), key=lambda item: item[1]['seconds'], reverse=True)
+        ]
+        return {
+            **self.notes,
+            'total_seconds': round(total, 6),
+            'stages': {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            'generators': generators,
+            'writes': self.writes,
+            'totals': {
+                'generated_bytes': sum(stats['bytes'] for stats in self.generators.values()),
+                'files_written': len(self.writes),
+                'bytes_written': sum(write['bytes'] for write in self.writes),
+            },
+        }
+
+    def write(self, report_path: Path):
+        """Write the JSON report and, if enabled, the cProfile dump."""
+        report_path = Path(report_path)
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        report_path.write_text(json.dumps(self.report(), indent=2) + "\n")
+        print(f"Profile report written to {report_path}")
+        if self._profile:
+            self._profile.dump_stats(str(self.cprofile_path))
+            print(f"cProfile data written to {self.cprofile_path}")
@@ -0,0 +1,114 @@
+"""Update-mode behaviour of OutputPlan.commit()"""
+
+from file_operations import MANIFEST_NAME, OutputPlan, content_hash, read_manifest
+
+
+def make_plan(files: dict) -> OutputPlan:
+    plan = OutputPlan()
+    for relative_path, content in files.items():
+        plan.add_file(relative_path, content)
+    return plan
+
+
+def test_first_commit_writes_every_file_and_the_manifest(tmp_path):
+    app_path = tmp_path / "app"
+    report = make_plan({"app.py": "v1", "routes/main.py": "routes"}).commit(app_path)
+
+    assert sorted(report["written"]) == ["app.py", "routes/main.py"]
+    assert (app_path / "routes/main.py").read_text() == "routes"
+    assert read_manifest(app_path) == {
+        "app.py": content_hash(b"v1"),
+        "routes/main.py": content_hash(b"routes"),
+    }
+
+
+def test_update_skips_unchanged_files(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"app.py": "v1", "settings.py": "s1"}).commit(app_path)
+    manifest_before = (app_path / MANIFEST_NAME).read_bytes()
+
+    report = make_plan({"app.py": "v2", "settings.py": "s1"}).commit(app_path, update=True)
+
+    assert report["written"] == ["app.py"]
+    assert report["unchanged"] == ["settings.py"]
+    assert report["conflicts"] == []
+    assert (app_path / "app.py").read_text() == "v2"
+    assert (app_path / MANIFEST_NAME).read_bytes() != manifest_before
+
+
+def test_update_with_nothing_changed_writes_nothing(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"app.py": "v1"}).commit(app_path)
+    mtime = (app_path / MANIFEST_NAME).stat().st_mtime_ns
+
+    report = make_plan({"app.py": "v1"}).commit(app_path, update=True)
+
+    assert report["written"] == []
+    assert report["unchanged"] == ["app.py"]
+    assert (app_path / MANIFEST_NAME).stat().st_mtime_ns == mtime
+
+
+def test_update_keeps_hand_edited_files(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"app.py": "v1", "settings.py": "s1"}).commit(app_path)
+    (app_path / "settings.py").write_text("edited by hand")
+
+    report = make_plan({"app.py": "v2", "settings.py": "s2"}).commit(app_path, update=True)
+
+    assert report["conflicts"] == ["settings.py"]
+    assert report["written"] == ["app.py"]
+    assert (app_path / "settings.py").read_text() == "edited by hand"
+    assert (app_path / "app.py").read_text() == "v2"
+
+
+def test_conflicting_file_keeps_its_previous_manifest_hash(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"settings.py": "s1"}).commit(app_path)
+    (app_path / "settings.py").write_text("edited by hand")
+
+    make_plan({"settings.py": "s2"}).commit(app_path, update=True)
+
+    # The hash of the last generated version is kept, not the new one, so the
+    # edit is still detected on the next update instead of being overwritten
+    assert read_manifest(app_path)["settings.py"] == content_hash(b"s1")
+    report = make_plan({"settings.py": "s3"}).commit(app_path, update=True)
+    assert report["conflicts"] == ["settings.py"]
+    assert (app_path / "settings.py").read_text() == "edited by hand"
+
+
+def test_untracked_existing_file_is_a_conflict_and_stays_out_of_the_manifest(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"app.py": "v1"}).commit(app_path)
+    (app_path / "README.md").write_text("written by the user")
+
+    report = make_plan({"app.py": "v1", "README.md": "generated"}).commit(app_path, update=True)
+
+    assert report["conflicts"] == ["README.md"]
+    assert (app_path / "README.md").read_text() == "written by the user"
+    assert "README.md" not in read_manifest(app_path)
+
+
+def test_reverted_hand_edit_is_updated_again(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"settings.py": "s1"}).commit(app_path)
+    (app_path / "settings.py").write_text("edited by hand")
+    make_plan({"settings.py": "s2"}).commit(app_path, update=True)
+    (app_path / "settings.py").write_text("s1")
+
+    report = make_plan({"settings.py": "s2"}).commit(app_path, update=True)
+
+    assert report["written"] == ["settings.py"]
+    assert report["conflicts"] == []
+    assert (app_path / "settings.py").read_text() == "s2"
+    assert read_manifest(app_path)["settings.py"] == content_hash(b"s2")
+
+
+def test_without_update_hand_edits_are_overwritten(tmp_path):
+    app_path = tmp_path / "app"
+    make_plan({"settings.py": "s1"}).commit(app_path)
+    (app_path / "settings.py").write_text("edited by hand")
+
+    report = make_plan({"settings.py": "s2"}).commit(app_path)
+
+    assert report["written"] == ["settings.py"]
+    assert (app_path / "settings.py").read_text() == "s2"
@@ -0,0 +1,60 @@
+"""Update-mode behaviour of FlaskWizard.generate_app()"""
+
+from batch_mode import normalize_config
+from file_operations import read_generated_at
+from main_wizard import FlaskWizard
+
+CONFIG = normalize_config({'app_name': 'demo'})
+
+
+def generate(tmp_path, config, **options):
+    return FlaskWizard(config=config, output_dir=tmp_path, use_cache=False, **options).generate_app()
+
+
+def test_update_reuses_the_previous_generation_time(tmp_path, monkeypatch):
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    generate(tmp_path, {**CONFIG, 'generated_at': '2001-02-03T04:05:06'})
+
+    report = generate(tmp_path, CONFIG, update=True)
+
+    assert report['written'] == []
+    assert report['conflicts'] == []
+    assert read_generated_at(tmp_path / 'demo') == '2001-02-03T04:05:06'
+
+
+def test_unpinned_generation_records_its_time_in_the_manifest(tmp_path, monkeypatch):
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    generate(tmp_path, CONFIG)
+
+    generated_at = read_generated_at(tmp_path / 'demo')
+    assert generated_at is not None
+    assert f"Generated: {generated_at.replace('T', ' ')}" in (tmp_path / 'demo' / 'app.py').read_text()
+
+
+def test_titles_and_page_names_render_literally_in_generated_templates(tmp_path):
+    import html
+    import jinja2
+    from datetime import datetime
+
+    name = 'Q&A {{ 7 * 7 }} <b>"x"</b>'
+    config = normalize_config({
+        'app_name': 'demo',
+        'app_title': name,
+        'nav_items': [{'name': 'Home', 'route': '/', 'icon': 'house'},
+                      {'name': name, 'route': '/qa', 'icon': 'chat"><script>'}],
+    })
+    plan = FlaskWizard(config=config, output_dir=tmp_path, use_cache=False).build_plan()
+    templates = {path[len('templates/'):]: content.decode('utf-8')
+                 for path, content in plan.files.items() if path.startswith('templates/')}
+    # The generated app renders its templates with autoescaping on, as Flask does
+    environment = jinja2.Environment(loader=jinja2.DictLoader({**templates, 'base.html': '{% block content %}{% endblock %}'}),
+                                     autoescape=True)
+    environment.globals.update(datetime=datetime, format_datetime=str, url_for=lambda endpoint, **values: '/')
+
+    page_template = next(t for t in templates if t not in ('base.html', 'dashboard.html', 'error.html'))
+    for template_name in ('dashboard.html', page_template):
+        rendered = environment.get_template(template_name).render()
+        assert '49' not in rendered
+        assert '<b>' not in rendered and '<script>' not in rendered
+        assert name in html.unescape(rendered)
+    environment.parse(templates['base.html'])
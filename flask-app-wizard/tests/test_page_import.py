@@ -0,0 +1,63 @@
+"""Sitemap import and the routes nav pages may take"""
+
+import pytest
+
+from app_generator.routes import assign_nav_endpoints
+from batch_mode import normalize_config
+from main_wizard import FlaskWizard
+from page_import import load_pages
+
+
+def build_plan(tmp_path, nav_items):
+    config = normalize_config({'app_name': 'demo', 'nav_items': nav_items,
+                               'features': {'api_endpoints': True, 'metrics': True}})
+    return FlaskWizard(config=config, output_dir=tmp_path, use_cache=False).build_plan()
+
+
+def main_routes(plan) -> str:
+    return plan.files['routes/main.py'].decode('utf-8')
+
+
+def test_settings_template_is_generated_without_a_settings_page(tmp_path):
+    sitemap = tmp_path / 'sitemap.csv'
+    sitemap.write_text("name,route\nHome,/\nReports,/reports\n")
+
+    plan = build_plan(tmp_path, load_pages(sitemap))
+
+    assert 'templates/settings.html' in plan.files
+    assert "render_template('settings.html'" in main_routes(plan)
+
+
+@pytest.mark.parametrize('route', ['/settings/', '/submit_feedback', '/livez', '/readyz', '/metrics',
+                                   '/api', '/api/status', '/assets/app.js', '/static/', '/static/css/x.css'])
+def test_load_pages_rejects_builtin_routes(tmp_path, route):
+    sitemap = tmp_path / 'sitemap.csv'
+    sitemap.write_text(f"name,route\nHome,/\nClash Page,{route}\n")
+
+    with pytest.raises(ValueError, match=r"entry 2: page 'Clash Page': route .* clashes"):
+        load_pages(sitemap)
+
+
+def test_assign_nav_endpoints_rejects_builtin_routes():
+    with pytest.raises(ValueError, match="page 'Health'"):
+        assign_nav_endpoints([{'name': 'Health', 'route': '/readyz', 'icon': 'heart'}])
+
+
+def test_page_at_settings_becomes_the_builtin_settings_view(tmp_path):
+    plan = build_plan(tmp_path, [{'name': 'Home', 'route': '/', 'icon': 'home'},
+                                 {'name': 'Preferences', 'route': '/settings', 'icon': 'gear'}])
+
+    assert main_routes(plan).count("route('/settings')") + main_routes(plan).count('route("/settings")') == 1
+    assert 'Preferences' in plan.files['templates/settings.html'].decode('utf-8')
+
+
+def test_settings_page_with_a_custom_route_keeps_it(tmp_path):
+    [home, settings] = assign_nav_endpoints([{'name': 'Home', 'route': '/', 'icon': 'home'},
+                                             {'name': 'Settings', 'route': '/prefs', 'icon': 'gear'}])
+    assert settings['endpoint'] not in ('dashboard', 'settings')
+
+    plan = build_plan(tmp_path, [home, settings])
+
+    assert f"@main_bp.route(\"/prefs\")\ndef {settings['endpoint']}():" in main_routes(plan)
+    assert f"templates/{settings['endpoint']}.html" in plan.files
+    assert 'templates/settings.html' in plan.files
@@ -3,6 +3,7 @@ Wizard Prompts Module
 Handles all user input gathering for the Flask App Generator using Questionary.
 """
 import sys
+from pathlib import Path
 import questionary
 from questionary import Style
 
@@ -73,15 +74,39 @@ def gather_nav_info() -> list:
         {"name": "Settings", "route": "/settings", "icon": "gear"}
     ]
     
-    use_defaults = questionary.confirm(
-        "Use default navigation (Dashboard, Settings)?",
-        default=True,
+    nav_source = questionary.select(
+        "How do you want to set up navigation?",
+        choices=[
+            questionary.Choice("Default navigation (Dashboard, Settings)", "defaults"),
+            questionary.Choice("Import pages from a CSV/JSON sitemap", "import"),
+            questionary.Choice("Enter pages one by one", "manual")
+        ],
+        default="defaults",
         style=wizard_style
     ).ask()
     
-    if use_defaults:
+    if nav_source == "defaults":
         return default_items
     
+    if nav_source == "import":
+        from page_import import load_pages
+        pages_path = questionary.path(
+            "Sitemap file (.csv or .json):",
+            validate=lambda text: Path(text).is_file() or "File not found",
+            style=wizard_style
+        ).ask()
+        if not pages_path:
+            # Prompt cancelled (Ctrl-C returns None)
+            print("No sitemap chosen; using the default navigation.")
+            return default_items
+        try:
+            nav_items = load_pages(Path(pages_path))
+        except ValueError as e:
+            print(f"Could not import {pages_path}: {e}; using the default navigation.")
+            return default_items
+        print(f"Imported {len(nav_items)} pages from {pages_path}")
+        return nav_items
+    
     nav_items = []
     print("\nEnter your navigation items:")
     
@@ -108,6 +133,7 @@ def gather_nav_info() -> list:
         route = questionary.text(
             f"Route for '{item_name}':",
             default=default_route,
+            validate=lambda text: _route_error(item_name, text) or True,
             style=wizard_style
         ).ask()
         
@@ -130,15 +156,22 @@ def gather_nav_info() -> list:
             "route": route,
             "icon": icon
         })
-        
-        # Break if they have quite a few items
-        if len(nav_items) >= 8:
-            questionary.print("That's quite a few items! You can always add more later.", style="fg:#858585")
-            break
     
     return nav_items
 
 
+def _route_error(item_name: str, route: str):
+    """Why a nav route cannot be used, or None if it can."""
+    from app_generator.routes import check_nav_route
+    if not route.startswith('/'):
+        return "Route must start with /"
+    try:
+        check_nav_route({'name': item_name, 'route': route})
+    except ValueError as e:
+        return str(e)
+    return None
+
+
 def gather_features() -> dict:
     """Collect feature requirements from the user."""
     print("\n🔧 Features & Options")
@@ -162,7 +195,8 @@ def gather_features() -> dict:
             questionary.Choice("User authentication", "user_auth"),
             questionary.Choice("File upload handling", "file_uploads"),
             questionary.Choice("REST API endpoints", "api_endpoints"),
-            questionary.Choice("Background task support", "background_tasks")
+            questionary.Choice("Background task support", "background_tasks"),
+            questionary.Choice("Request metrics (Prometheus /metrics endpoint)", "metrics")
         ],
         style=wizard_style
     ).ask()
@@ -173,6 +207,7 @@ def gather_features() -> dict:
         'file_uploads': 'file_uploads' in selected_features,
         'api_endpoints': 'api_endpoints' in selected_features,
         'background_tasks': 'background_tasks' in selected_features,
+        'metrics': 'metrics' in selected_features,
     }
     
     return {'database': database_choice, 'features': features}
@@ -188,7 +223,7 @@ def confirm_config(config: dict) -> bool:
     
     features = config.get('features', {})
     print(f"Database: {features.get('database', 'sqlite')}")
-    feature_keys = ['user_auth', 'file_uploads', 'api_endpoints', 'background_tasks']
+    feature_keys = ['user_auth', 'file_uploads', 'api_endpoints', 'background_tasks', 'metrics']
     selected_features = [k.replace('_', ' ').title() for k in feature_keys if features.get(k, False)]
     
     print(f"Navigation items: {len(config['nav_items'])}")